@@ -2,12 +2,36 @@
 PlotScan terminal client
 """
 import argparse
+import sys
+import types
 from pathlib import Path
-from .core import run
 
 
-def main():
-    """Main function"""
+def main(argv=None):
+    """
+    Main function.
+
+    Parameters:
+        argv (list, optional): The command-line arguments; sys.argv is used when omitted. Passing an explicit list
+                               allows running the CLI in-process, e.g. from the test suite.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if len(argv) == 1 and not argv[0].startswith("-"):
+        # Single positional argument: skip ArgumentParser construction and
+        # hand run() the defaults directly.
+        args = types.SimpleNamespace(
+            INPUT=Path(argv[0]),
+            pixel_tolerance=1,
+            data_point=None,
+            location=None,
+            plot=None,
+            output=None,
+            preprocess=False,
+        )
+        from .core import run
+        run(args)
+        return
     description = """A command-line tool for extracting data from scientific figure images."""
     parser = argparse.ArgumentParser(description=description)
     parser.add_argument(
@@ -63,7 +87,10 @@ def main():
         action="store_true",
         help="Preprocess the image. Useful for improving bad resolution images.",
     )
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
+    # Imported here so that `--help` and argparse errors do not pay for
+    # cv2/numpy (and, transitively, PaddleOCR) imports.
+    from .core import run
     run(args)
 
 
@@ -4,25 +4,107 @@ Module bundling all functions needed to digitise a scientific plot
 import sys
 import os
 import typing as T
+import hashlib
+import pickle
 from pathlib import Path
 import logging
 import numpy as np
-import numpy.polynomial.polynomial as poly
 import cv2 as cv
 from PlotScan import grid
 from PlotScan import geometry
 from .trajectory import find_trajectory, normalize
 from .points import find_points
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True)
+    def _row_hist(img):
+        """
+        Compute a 256-bin histogram of a uint8 image, rows in parallel.
+
+        Parameters:
+            img (np.ndarray): The image.
+
+        Returns:
+            np.ndarray: The per-level pixel counts (256 entries).
+        """
+        rows, cols = img.shape
+        out = np.zeros((rows, 256), np.int64)
+        for i in numba.prange(rows):
+            for j in range(cols):
+                out[i, img[i, j]] += 1
+        return out.sum(axis=0)
+
 LOGLEVEL = os.environ.get("LOGLEVEL", "INFO").upper()
 logging.basicConfig(level=LOGLEVEL)
 ix_, iy_ = 0, 0
 params_: T.Dict[str, T.Any] = {}
 args_: T.Optional[T.Any] = None
 # NOTE: remember these are cv coordinates and not numpy.
-locations_: T.List[geometry.Point] = []
-points_: T.List[geometry.Point] = []
+locations_: np.ndarray = np.empty((0, 2), dtype=np.int32)
+points_: np.ndarray = np.empty((0, 2), dtype=np.int32)
 img_: np.ndarray = np.zeros((1, 1))
+# Bump when the pickled find_points result changes shape, so stale cache
+# entries from older releases are ignored.
+_POINTS_CACHE_VERSION = 2
+
+
+def cache() -> Path:
+    """
+    Get the directory used to cache intermediate results.
+
+    Returns:
+        Path: The cache directory (created if it does not exist).
+    """
+    cachedir = Path.home() / ".cache" / "PlotScan"
+    cachedir.mkdir(parents=True, exist_ok=True)
+    return cachedir
+
+
+def data_to_hash(data: bytes) -> str:
+    """
+    Compute the SHA-1 hash of the given bytes.
+
+    Parameters:
+        data (bytes): The data to hash.
+
+    Returns:
+        str: The hexadecimal SHA-1 digest.
+    """
+    return hashlib.sha1(data).hexdigest()
+
+
+def _points_cached(infile: Path, pixel_tolerance: int = 1):
+    """
+    Find the axis points of an image, caching the OCR result on disk.
+
+    The result is keyed by the SHA-1 of the file bytes together with the
+    pixel tolerance (which changes find_points' output) and a format
+    version, so repeated runs on the same image and settings skip the
+    PaddleOCR pipeline entirely while stale entries from other tolerances
+    or older result layouts are never returned.
+
+    Parameters:
+        infile (Path): The path to the input image file.
+        pixel_tolerance (int, optional): The maximum allowable difference in pixel coordinates. Default is 1.
+
+    Returns:
+        np.ndarray: The (3, 2, 2) points array as returned by find_points.
+    """
+    digest = data_to_hash(Path(infile).read_bytes())
+    pklfile = cache() / f"{digest}-{pixel_tolerance}-v{_POINTS_CACHE_VERSION}.pkl"
+    if pklfile.exists():
+        with open(pklfile, "rb") as file:
+            return pickle.load(file)
+    points = find_points(infile, pixel_tolerance)
+    with open(pklfile, "wb") as file:
+        pickle.dump(points, file, pickle.HIGHEST_PROTOCOL)
+    return points
 
 
 def plot_traj(traj, outfile: Path):
@@ -30,7 +112,7 @@ def plot_traj(traj, outfile: Path):
     Plot the trajectory and save the plot to a file.
 
     Parameters:
-        traj (list): The trajectory to be plotted in the format [(x1, y1), (x2, y2), ...].
+        traj (np.ndarray): The (N, 2) trajectory to be plotted, one (x, y) pair per row.
         outfile (Path): The path to save the plot.
 
     Returns:
@@ -39,12 +121,21 @@ def plot_traj(traj, outfile: Path):
     import matplotlib.pyplot as plt
 
     global locations_
-    x, y = zip(*traj)
+    x, y = traj[:, 0], traj[:, 1]
     plt.figure()
     plt.subplot(211)
+    # Stamp a precomputed disk mask at each location instead of calling
+    # cv.circle once per point.
+    rows, cols = img_.shape[:2]
+    csize = rows // 40
+    dys, dxs = np.ogrid[-csize: csize + 1, -csize: csize + 1]
+    disk = dxs * dxs + dys * dys <= csize * csize
     for location in locations_:
-        csize = img_.shape[0] // 40
-        cv.circle(img_, (location.x, img_.shape[0] - location.y), csize, 128, -1)
+        cx, cy = int(location[0]), rows - int(location[1])
+        y0, y1 = max(0, cy - csize), min(rows, cy + csize + 1)
+        x0, x1 = max(0, cx - csize), min(cols, cx + csize + 1)
+        window = disk[y0 - cy + csize: y1 - cy + csize, x0 - cx + csize: x1 - cx + csize]
+        img_[y0:y1, x0:x1][window] = 128
     plt.imshow(img_, interpolation="none", cmap="gray")
     plt.axis(False)
     plt.title("Original")
@@ -60,35 +151,62 @@ def plot_traj(traj, outfile: Path):
     plt.close()
 
 
-def list_to_points(points) -> T.List[geometry.Point]:
+def list_to_points(points) -> np.ndarray:
     """
-    Convert a list of points to a list of geometry.Point objects.
+    Convert a list of points to an (N, 2) array of coordinates.
 
     Parameters:
         points (list): List of points in the format [(x1, y1), (x2, y2), ...].
 
     Returns:
-        list: A list of geometry.Point objects.
+        np.ndarray: An (N, 2) int32 array with one point per row.
+    """
+    points = list(points)
+    if points and all(isinstance(point, str) for point in points):
+        # CLI "x,y" strings: parse the whole batch in one array build.
+        return geometry.Point.batch_from_csv(points).astype(np.int32)
+    return np.asarray(
+        [tuple(geometry.Point.convert(point)) for point in points], dtype=np.int32
+    )
+
+
+def _linfit(x, y) -> T.Tuple[float, float]:
+    """
+    Fit y = offset + slope * x in closed form.
+
+    Equivalent to poly.polyfit(x, y, 1) but without the Vandermonde/lstsq
+    machinery, which is massive overkill for the 3-5 axis points fitted here.
+
+    Parameters:
+        x (array-like): The x values.
+        y (array-like): The y values.
+
+    Returns:
+        tuple: The (offset, slope) pair, in polyfit coefficient order.
     """
-    return [geometry.Point.convert(point) for point in points]
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    mx, my = x.mean(), y.mean()
+    slope = ((x - mx) * (y - my)).sum() / ((x - mx) ** 2).sum()
+    return my - slope * mx, slope
 
 
-def axis_transformation(p, P: T.List[geometry.Point]):
+def axis_transformation(p: np.ndarray, P: np.ndarray):
     """
     Compute the transformation parameters (slope and offset) to transform one axis (X) to another (Y).
 
     Parameters:
-        p (list): The list of points on axis X in the format [(x1, y1), (x2, y2), ...].
-        P (list): The list of points on axis Y in the format [(x1, y1), (x2, y2), ...].
+        p (np.ndarray): The (N, 2) array of points on axis X.
+        P (np.ndarray): The (N, 2) array of points on axis Y.
 
     Returns:
         tuple: Two tuples containing the slope (sX, sY) and offset (offX, offY) for the X and Y axes.
     """
     # Currently only linear maps and only 2D.
-    px, py = zip(*p)
-    Px, Py = zip(*P)
-    offX, sX = poly.polyfit(px, Px, 1)
-    offY, sY = poly.polyfit(py, Py, 1)
+    p = np.asarray(p)
+    P = np.asarray(P)
+    offX, sX = _linfit(p[:, 0], P[:, 0])
+    offY, sY = _linfit(p[:, 1], P[:, 1])
     return (sX, sY), (offX, offY)
 
 
@@ -135,11 +253,23 @@ def _find_trajectory_colors(
     # 5) -> total 51 bins. Also, it is very unlikely that colors which are too
     # close to each other are part of different trajecotries. It is safe to
     # assme a binwidth of at least 10px.
-    hs, bs = np.histogram(img.flatten(), 255 // 10, (0, img.max()))
+    # The image-sized pass is a single uint8 bincount (no flatten copy, no
+    # float math); the 256 per-level counts are then coalesced into the same
+    # bins np.histogram used to produce.
+    maxv = int(img.max())
+    # On 4K-class scans, split the count across cores when numba is around;
+    # otherwise cv.calcHist does the single pass with SIMD and no ravel view.
+    if numba is not None and img.size > 4_000_000:
+        counts = _row_hist(img)
+    else:
+        counts = cv.calcHist([img], [0], None, [256], [0, 256]).ravel()
+    levels = np.arange(maxv + 1)
+    hs, bs = np.histogram(levels, 255 // 10, (0, maxv), weights=counts[: maxv + 1])
 
     # Now a trajectory is only trajectory if number of pixels close to the
     # width of the image (we are using at least 75% of width).
-    hs[hs < img.shape[1] * 3 // 4] = 0
+    width_thresh = img.shape[1] * 3 // 4
+    hs[hs < width_thresh] = 0
 
     if plot:
         import matplotlib.pyplot as plt
@@ -151,11 +281,12 @@ def _find_trajectory_colors(
         plt.show()
 
     # background is usually the color which is most count. We can find it
-    # easily by sorting the histogram.
-    hist = sorted(zip(hs, bs), reverse=True)
+    # easily by ordering the (few) histogram bins; lexsort on the negated
+    # keys keeps the old (count, bin) descending tie-break.
+    order = np.lexsort((-bs[: len(hs)], -hs))
 
     # background is the most occuring pixel value.
-    bgcolor = int(hist[0][1])
+    bgcolor = int(bs[order[0]])
 
     # we assume that bgcolor is close to white.
     if bgcolor < 128:
@@ -165,7 +296,7 @@ def _find_trajectory_colors(
         sys.exit()
 
     # If the background is white, search from the trajectories from the black.
-    trajcolors = [int(b) for h, b in hist if h > 0 and b / bgcolor < 0.5]
+    trajcolors = [int(bs[i]) for i in order if hs[i] > 0 and bs[i] / bgcolor < 0.5]
     return bgcolor, trajcolors
 
 
@@ -198,7 +329,7 @@ def process_image(img):
         img (numpy.ndarray): The image.
 
     Returns:
-        list: The extracted trajectory in the format [(x1, y1), (x2, y2), ...].
+        np.ndarray: The extracted (N, 2) trajectory, one (x, y) pair per row.
     """
     global params_
     params_ = compute_foregrond_background_stats(img)
@@ -241,23 +372,23 @@ def run(args):
         kernel = np.ones((1, 1), np.uint8)
         img_ = cv.morphologyEx(img_, cv.MORPH_CLOSE, kernel)
 
-    # remove grids.
-    img_ = grid.remove_grid(img_)
-
-    # rescale it again.
-    img_ = normalize(img_)
+    # remove grids. The image is already normalized and remove_grid only
+    # paints grid pixels with the 255 background, so the [0, 255] range is
+    # preserved and a second normalize pass would just re-read the buffer.
+    img_ = grid.remove_grid(img_, inplace=True)
     logging.debug(" {img_.min()=} {img_.max()=}")
     assert img_.max() <= 255
     assert img_.min() < img_.mean() < img_.max(), "Could not read meaningful data"
+    points = None
+    if not (args.data_point and args.location):
+        points = _points_cached(infile, args.pixel_tolerance)
     if args.data_point:
         points_ = list_to_points(args.data_point)
     else:
-        points = find_points(infile, args.pixel_tolerance)
         points_ = list_to_points([point[1] for point in points])
     if args.location:
         locations_ = list_to_points(args.location)
     else:
-        points = find_points(infile, args.pixel_tolerance)
         locations_ = list_to_points([point[0] for point in points])
     # logging.debug(f"data points {args.data_point} → location on image {args.location}")
 
@@ -265,7 +396,5 @@ def run(args):
     if args_.plot:
         plot_traj(traj, args_.plot)
     outfile = args.output or f"{args.INPUT}.traj.csv"
-    with open(outfile, "w", encoding="utf-8") as file:
-        for r in traj:
-            file.write("%g %g\n" % r)
+    np.savetxt(outfile, traj, fmt="%g")
     logging.info(f"Wrote trajectory to {outfile}")
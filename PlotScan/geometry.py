@@ -32,8 +32,8 @@ Note:
       average of the vertical and horizontal points.
 """
 import typing as T
-import statistics
 import math
+import numpy as np
 
 
 class Point:
@@ -63,6 +63,9 @@ class Point:
         __iter__(self) -> iterator:
             Returns an iterator for the Point object containing x and y coordinates.
     """
+
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         """
         Initialize a Point object with x and y coordinates.
@@ -95,6 +98,19 @@ class Point:
             xy = [float(coord) for coord in coords]
         return cls(xy[0], xy[1])
 
+    @classmethod
+    def batch_from_csv(cls, coords: T.List[str]) -> np.ndarray:
+        """
+        Convert a list of "x,y" strings to an (N, 2) array in one pass.
+
+        Parameters:
+            coords (List[str]): The comma-separated coordinate strings.
+
+        Returns:
+            np.ndarray: An (N, 2) float64 array of the parsed coordinates.
+        """
+        return np.array([coord.split(",") for coord in coords], dtype=np.float64)
+
     def __eq__(self, other) -> bool:
         """
         Check if two Point objects are equal.
@@ -135,30 +151,25 @@ class Point:
         return iter((self.x, self.y))
 
 
-def find_origin(points: T.List[Point]) -> Point:
+def find_origin(points: T.Union[T.List[Point], np.ndarray]) -> Point:
     """
     Compute the origin of given points.
 
     Parameters:
-        points (List[Point]): A list of Point objects representing the points.
+        points (Union[List[Point], np.ndarray]): The points, as Point objects or (N, 2) array rows.
 
     Returns:
         Point: The Point object representing the origin.
     """
-    horizontal = set()
-    for i, point1 in enumerate(points):
-        for point2 in points[i + 1:]:
-            if abs(point1.x - point2.x) <= 2:
-                continue
-            m = (point2.y - point1.y) / (point2.x - point1.x)
-            if abs(m) < math.tan(math.pi / 180 * 5):  # <5 deg is horizontal.
-                horizontal.add(point1)
-                horizontal.add(point2)
-
-    points = set(points)
+    pts = np.unique(np.asarray([tuple(point) for point in points], dtype=np.float64), axis=0)
+    dx = pts[:, 0, None] - pts[None, :, 0]
+    dy = pts[:, 1, None] - pts[None, :, 1]
+    # A pair is colinear horizontally when its slope is below tan(5 deg);
+    # pairs closer than 2px in x are ignored, as before.
+    hpairs = (np.abs(dx) > 2) & (np.abs(dy) < np.abs(dx) * math.tan(math.pi / 180 * 5))
+    hmask = hpairs.any(axis=1)
+    horizontal = pts[hmask]
+    verticals = pts[~hmask]
     assert len(horizontal) > 1, f"Must have at least two colinear points {horizontal}"
-    verticals = points - horizontal
     assert len(verticals) > 0, "Must be at least one vertical point"
-    origin_y = statistics.mean([point.y for point in horizontal])
-    origin_x = statistics.mean([point.x for point in verticals])
-    return Point(origin_x, origin_y)
+    return Point(verticals[:, 0].mean(), horizontal[:, 1].mean())
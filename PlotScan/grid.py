@@ -37,6 +37,33 @@ Usage:
 import cv2 as cv
 import numpy as np
 
+try:
+    _HAVE_CUDA = cv.cuda.getCudaEnabledDeviceCount() > 0
+except (AttributeError, cv.error):
+    _HAVE_CUDA = False
+
+
+def _morph_open(thres, kernel, num_iter):
+    """
+    Run a morphological opening, on the GPU when OpenCV was built with CUDA.
+
+    Parameters:
+        thres (np.ndarray): The binary image to open.
+        kernel (np.ndarray): The structuring element.
+        num_iter (int): The number of iterations.
+
+    Returns:
+        np.ndarray: The opened image.
+    """
+    if _HAVE_CUDA:
+        gpu = cv.cuda_GpuMat()
+        gpu.upload(thres)
+        morph = cv.cuda.createMorphologyFilter(
+            cv.MORPH_OPEN, cv.CV_8UC1, kernel, iterations=num_iter
+        )
+        return morph.apply(gpu).download()
+    return cv.morphologyEx(thres, cv.MORPH_OPEN, kernel, iterations=num_iter)
+
 
 def remove_horizontal_grid_simple(img) -> np.ndarray:
     """
@@ -49,29 +76,31 @@ def remove_horizontal_grid_simple(img) -> np.ndarray:
         np.ndarray: The image after removing horizontal grid lines as a NumPy array representing grayscale image data.
     """
     mu, sigma = img.mean(), img.std()
-    for i, row in enumerate(img):
-        if row.mean() < mu - sigma:
-            # I can simply remove the row.
-            img[i, :] = img.max()
+    maxv = int(img.max())
+    row_means = img.mean(axis=1)
+    # rows darker than mu - sigma can simply be removed in one masked store.
+    img[row_means < mu - sigma, :] = maxv
     return img
 
 
-def heal(orig):
+def heal(orig, inplace: bool = False):
     """
     Perform a morphological operation to heal the image and remove small grid artifacts.
 
     Parameters:
         orig (np.ndarray): The original image as a NumPy array representing grayscale image data.
+        inplace (bool, optional): If True, overwrite orig instead of allocating a copy (default is False).
 
     Returns:
         np.ndarray: The healed image as a NumPy array representing grayscale image data.
     """
     kernel = np.ones((3, 3), np.uint8)
-    return cv.morphologyEx(orig.copy(), cv.MORPH_OPEN, kernel, iterations=2)
+    img = orig if inplace else orig.copy()
+    return cv.morphologyEx(img, cv.MORPH_OPEN, kernel, dst=img, iterations=2)
 
 
 def remove_grid(
-    orig, num_iter=3, background_color: int = 255, grid_size: int = 2
+    orig, num_iter=3, background_color: int = 255, grid_size: int = 2, inplace: bool = False
 ) -> np.ndarray:
     """
     Remove grid lines from the image using a combination of morphological operations.
@@ -82,29 +111,25 @@ def remove_grid(
         background_color (int, optional): The color value to be used for the background after removing the grid lines
                                           (default is 255).
         grid_size (int, optional): The thickness of grid lines to be removed (default is 2).
+        inplace (bool, optional): If True, overwrite orig instead of allocating a copy (default is False).
 
     Returns:
         np.ndarray: The image after removing grid lines as a NumPy array representing grayscale image data.
     """
-    img = orig.copy()
+    img = orig if inplace else orig.copy()
     thres = cv.threshold(img, 0, 255, cv.THRESH_BINARY_INV + cv.THRESH_OTSU)[1]
     # Remove horizontal lines
     horizontal_kernel = cv.getStructuringElement(cv.MORPH_RECT, (40, 1))
-    remove_horizontal = cv.morphologyEx(
-        thres, cv.MORPH_OPEN, horizontal_kernel, iterations=num_iter
-    )
-    cnts = cv.findContours(remove_horizontal, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
-    cnts = cnts[0] if len(cnts) == 2 else cnts[1]
-    for cnt in cnts:
-        cv.drawContours(img, [cnt], -1, background_color, grid_size)
+    remove_horizontal = _morph_open(thres, horizontal_kernel, num_iter)
+    # The opened image is already a binary mask of the detected grid lines;
+    # thicken it by grid_size and paint the background over it in one masked
+    # store instead of rasterizing each contour separately.
+    mask_h = cv.dilate(remove_horizontal, np.ones((grid_size, grid_size), np.uint8))
+    img[mask_h > 0] = background_color
 
     # Remove vertical lines
     vertical_kernel = cv.getStructuringElement(cv.MORPH_RECT, (1, 40))
-    remove_vertical = cv.morphologyEx(
-        thres, cv.MORPH_OPEN, vertical_kernel, iterations=num_iter
-    )
-    cnts = cv.findContours(remove_vertical, cv.RETR_EXTERNAL, cv.CHAIN_APPROX_SIMPLE)
-    cnts = cnts[0] if len(cnts) == 2 else cnts[1]
-    for cnt in cnts:
-        cv.drawContours(img, [cnt], -1, background_color, grid_size)
+    remove_vertical = _morph_open(thres, vertical_kernel, num_iter)
+    mask_v = cv.dilate(remove_vertical, np.ones((grid_size, grid_size), np.uint8))
+    img[mask_v > 0] = background_color
     return img
@@ -1,7 +1,212 @@
 """
 Utility functions for detecting points from a scientific figure using OCR.
 """
-from paddleocr import PaddleOCR
+import math
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+import numpy as np
+
+# sin^2 of the 5-degree default tolerance, folded at import time.
+_SIN2_ORTHO_TOL = math.sin(math.radians(5)) ** 2
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+if numba is not None:
+
+    @numba.njit(fastmath=True, cache=True)
+    def _overlap_matrix(aabbs):
+        """
+        Compute the symmetric AABB overlap matrix of (xmin, ymin, xmax, ymax) rows.
+
+        Args:
+            aabbs (np.ndarray): An (N, 4) array of bounding boxes.
+
+        Returns:
+            np.ndarray: An (N, N) boolean matrix, True where boxes overlap.
+        """
+        n = aabbs.shape[0]
+        out = np.zeros((n, n), np.bool_)
+        for i in range(n):
+            for j in range(i + 1, n):
+                hit = (
+                    (aabbs[i, 2] >= aabbs[j, 0])
+                    and (aabbs[i, 0] <= aabbs[j, 2])
+                    and (aabbs[i, 3] >= aabbs[j, 1])
+                    and (aabbs[i, 1] <= aabbs[j, 3])
+                )
+                out[i, j] = hit
+                out[j, i] = hit
+        return out
+
+else:
+
+    def _overlap_matrix(aabbs):
+        """
+        Compute the symmetric AABB overlap matrix of (xmin, ymin, xmax, ymax) rows.
+
+        Args:
+            aabbs (np.ndarray): An (N, 4) array of bounding boxes.
+
+        Returns:
+            np.ndarray: An (N, N) boolean matrix, True where boxes overlap.
+        """
+        return (
+            (aabbs[:, None, 2] >= aabbs[None, :, 0])
+            & (aabbs[:, None, 0] <= aabbs[None, :, 2])
+            & (aabbs[:, None, 3] >= aabbs[None, :, 1])
+            & (aabbs[:, None, 1] <= aabbs[None, :, 3])
+        )
+
+
+@dataclass
+class PointSet:
+    """
+    Structure-of-arrays view of OCR point records.
+
+    Attributes:
+        corners (np.ndarray): An (N, 4, 2) float32 array of box corners.
+        centers (np.ndarray): An (N, 2) float32 array of box centers.
+        labels (np.ndarray): An (N,) float64 array of the recognized labels.
+    """
+
+    corners: np.ndarray
+    centers: np.ndarray
+    labels: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    @classmethod
+    def from_points(cls, points) -> "PointSet":
+        """
+        Build a PointSet from the nested-list point records.
+
+        Args: points (list): List of points in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x,
+        center_y], label].
+
+        Returns:
+            PointSet: The parallel-array representation of the points.
+        """
+        return cls(
+            corners=np.asarray([point[0] for point in points], dtype=np.float32),
+            centers=np.asarray([point[1] for point in points], dtype=np.float32),
+            labels=np.asarray([point[2] for point in points], dtype=np.float64),
+        )
+
+
+@lru_cache(maxsize=8)
+def _get_ocr(lang: str, use_angle_cls: bool = False):
+    """
+    Get a PaddleOCR instance for the given language, constructing it at most once.
+
+    Model weights are loaded from disk and warmed up on construction, which
+    dwarfs every other cost in this module; the cache makes that a one-time
+    price per language.
+
+    Parameters:
+        lang (str): The PaddleOCR language code.
+        use_angle_cls (bool, optional): Whether to run the text-angle classifier. Axis ticks on
+                                        horizontal plots do not need it. Default is False.
+
+    Returns:
+        PaddleOCR: The cached OCR engine.
+    """
+    # Imported lazily: PaddleOCR pulls in paddlepaddle, which is only needed
+    # when the user did not pass the axis points on the command line.
+    try:
+        from paddleocr import PaddleOCR
+    except ImportError as error:
+        raise ImportError(
+            "paddleocr is required to detect axis points; install it with 'pip install PlotScan[ocr]' "
+            "or pass --data-point/--location on the command line."
+        ) from error
+
+    return PaddleOCR(use_angle_cls=use_angle_cls, lang=lang)
+
+
+def _sorted_by(records, keys) -> list:
+    """
+    Sort a list of records by a parallel list of numeric keys with np.argsort.
+
+    Args:
+        records (list): The records to reorder.
+        keys (list): One numeric sort key per record.
+
+    Returns:
+        list: The records in ascending key order (stable).
+    """
+    order = np.argsort(np.asarray(keys, dtype=np.float64), kind="stable")
+    return [records[i] for i in order]
+
+
+def _aabb(corners) -> np.ndarray:
+    """
+    Compute the axis-aligned bounding box of one set of corners.
+
+    Args:
+        corners (list): The corners in the format [[x1, y1], [x2, y2], [x3, y3], [x4, y4]].
+
+    Returns:
+        np.ndarray: A (4,) float32 array of (xmin, ymin, xmax, ymax).
+    """
+    arr = np.asarray(corners, dtype=np.float32)
+    return np.concatenate((arr.min(axis=0), arr.max(axis=0)))
+
+
+def _to_aabb_array(rectangles) -> np.ndarray:
+    """
+    Compute axis-aligned bounding boxes for a list of rectangles.
+
+    Args: rectangles (list): List of rectangles in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x,
+    center_y], label].
+
+    Returns:
+        np.ndarray: An (N, 4) float32 array of (xmin, ymin, xmax, ymax) rows.
+    """
+    corners = np.asarray([rect[0] for rect in rectangles], dtype=np.float32)
+    return np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1)
+
+
+def _duplicate_keep_indices(corners, pixel_tolerance=1):
+    """
+    Greedy keep-first duplicate filter over a stacked corner array.
+
+    Parameters:
+        corners (np.ndarray): An (N, 4, 2) array of rectangle corners.
+        pixel_tolerance (int, optional): The maximum allowable difference in pixel coordinates for two rectangles to
+                                         be considered duplicate. Default is 1.
+
+    Returns:
+        list: Indices of the rectangles to keep, in input order.
+    """
+    equal = np.abs(corners[:, None] - corners[None, :]).max(axis=(-1, -2)) <= pixel_tolerance
+    kept: list = []
+    for i in range(len(corners)):
+        if not equal[i, kept].any():
+            kept.append(i)
+    return kept
+
+
+def _overlap_keep_indices(aabbs):
+    """
+    Greedy keep-first overlap filter over an AABB array.
+
+    Parameters:
+        aabbs (np.ndarray): An (N, 4) array of (xmin, ymin, xmax, ymax) rows.
+
+    Returns:
+        list: Indices of the rectangles to keep, in input order.
+    """
+    overlap = _overlap_matrix(aabbs)
+    kept: list = []
+    for i in range(len(aabbs)):
+        if not overlap[i, kept].any():
+            kept.append(i)
+    return kept
 
 
 def are_rectangles_equal(rect1, rect2, pixel_tolerance=1):
@@ -37,14 +242,20 @@ def remove_duplicate_rectangles(rectangles, pixel_tolerance=1):
     Returns:
         list: A list of unique rectangles after removing duplicates.
     """
-    unique_rectangles = []
-    for rect in rectangles:
-        is_duplicate = any(
-            are_rectangles_equal(rect, unique_rect, pixel_tolerance) for unique_rect in unique_rectangles)
-
-        if not is_duplicate:
-            unique_rectangles.append(rect)
-    return unique_rectangles
+    if not rectangles:
+        return []
+    if len({len(rect[0]) for rect in rectangles}) != 1:
+        # Mixed corner counts cannot be stacked; keep the pairwise path.
+        unique_rectangles = []
+        for rect in rectangles:
+            is_duplicate = any(
+                are_rectangles_equal(rect, unique_rect, pixel_tolerance) for unique_rect in unique_rectangles)
+
+            if not is_duplicate:
+                unique_rectangles.append(rect)
+        return unique_rectangles
+    corners = np.asarray([rect[0] for rect in rectangles], dtype=np.float32)
+    return [rectangles[i] for i in _duplicate_keep_indices(corners, pixel_tolerance)]
 
 
 def find_period(points, axis, pixel_tolerance=1):
@@ -59,30 +270,29 @@ def find_period(points, axis, pixel_tolerance=1):
     Returns:
         int or None: The period of the given axis if found, or None if no period is detected.
     """
-    lines = separate_lines(points, pixel_tolerance)
-    line = lines[axis]
-    labels = [point[2] for point in points if point in line]
+    line_idx = _separate_line_indices(points, pixel_tolerance)[axis]
+    labels = [points[i][2] for i in line_idx]
     differences = [labels[i - 1] - labels[i] for i in range(len(labels) - 1)]
-    return abs(max(set(differences), key=differences.count) if differences else None)
+    counts = Counter(differences)
+    return abs(max(set(differences), key=counts.get) if differences else None)
 
 
-def remove_overlapping_rectangles(rectangles):
+def remove_overlapping_rectangles(rectangles, aabbs=None):
     """
     Remove overlapping rectangles from the list of rectangles.
 
     Args: rectangles (list): List of rectangles in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x,
-    center_y], label].
+    center_y], label]. aabbs (np.ndarray, optional): Precomputed (N, 4) bounding boxes parallel to rectangles; when
+    omitted they are derived from the corners.
 
     Returns:
         list: A list of non-overlapping rectangles.
     """
-    unique_rectangles = []
-    for rect in rectangles:
-        is_overlapping = any(is_rect_overlapping(rect[0], unique_rect[0]) for unique_rect in unique_rectangles)
-
-        if not is_overlapping:
-            unique_rectangles.append(rect)
-    return unique_rectangles
+    if not rectangles:
+        return []
+    if aabbs is None:
+        aabbs = _to_aabb_array(rectangles)
+    return [rectangles[i] for i in _overlap_keep_indices(aabbs)]
 
 
 def is_rect_overlapping(rect1, rect2):
@@ -95,15 +305,35 @@ def is_rect_overlapping(rect1, rect2):
     Returns:
         bool: True if the rectangles are overlapping, False otherwise.
     """
-    x1_min = min(coord[0] for coord in rect1)
-    y1_min = min(coord[1] for coord in rect1)
-    x1_max = max(coord[0] for coord in rect1)
-    y1_max = max(coord[1] for coord in rect1)
-    x2_min = min(coord[0] for coord in rect2)
-    y2_min = min(coord[1] for coord in rect2)
-    x2_max = max(coord[0] for coord in rect2)
-    y2_max = max(coord[1] for coord in rect2)
-    return x1_max >= x2_min and x1_min <= x2_max and y1_max >= y2_min and y1_min <= y2_max
+    a = _aabb(rect1)
+    b = _aabb(rect2)
+    # Branchless separating-axis test on the two (xmin, ymin, xmax, ymax) rows.
+    return not bool((a[2] < b[0]) | (a[0] > b[2]) | (a[3] < b[1]) | (a[1] > b[3]))
+
+
+def are_lines_orthogonal(line1, line2, tol_deg=5):
+    """
+    Check if two lines are orthogonal within the given angular tolerance.
+
+    The test is |cos(angle)| <= sin(tol): four multiplies and an add on the
+    direction vectors, with no transcendental calls per invocation.
+
+    Args:
+        line1 (list): The first line as a pair of (x, y) endpoints.
+        line2 (list): The second line in the same format as line1.
+        tol_deg (float, optional): The angular tolerance in degrees. Default is 5.
+
+    Returns:
+        bool: True if the lines are orthogonal within tol_deg, False otherwise.
+    """
+    v1x = line1[1][0] - line1[0][0]
+    v1y = line1[1][1] - line1[0][1]
+    v2x = line2[1][0] - line2[0][0]
+    v2y = line2[1][1] - line2[0][1]
+    dot = v1x * v2x + v1y * v2y
+    norm2 = (v1x * v1x + v1y * v1y) * (v2x * v2x + v2y * v2y)
+    sin2 = _SIN2_ORTHO_TOL if tol_deg == 5 else math.sin(math.radians(tol_deg)) ** 2
+    return dot * dot <= norm2 * sin2
 
 
 def find_center_period(points, axis):
@@ -116,29 +346,35 @@ def find_center_period(points, axis):
     Returns:
         int: The center period of the given axis.
     """
-    sorted_points = sorted(points, key=lambda point: point[1][axis])
-    gaps = [
-        abs(sorted_points[i + 1][1][axis] - sorted_points[i][1][axis])
-        for i in range(len(sorted_points) - 1)
-    ]
-    return int(sum(gaps) / len(gaps))
+    centers = PointSet.from_points(points).centers
+    gaps = np.abs(np.diff(np.sort(centers[:, axis])))
+    return int(gaps.mean())
 
 
-def find_missing_points(points, pixel_tolerance=1):
+def find_missing_points(points, pixel_tolerance=1, aabbs=None):
     """
     Find missing points on the axis based on the given points, center periods, and label periods.
 
     Args: points (list): List of points in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x,
     center_y], label]. pixel_tolerance (int, optional): The maximum allowable difference in pixel coordinates.
-    Default is 1.
+    Default is 1. aabbs (np.ndarray, optional): Precomputed (N, 4) bounding boxes parallel to points; when omitted
+    they are derived from the corners.
 
     Returns: list: A list of missing points in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x,
     center_y], label].
     """
     missing_points = []
-    lines = separate_lines(points, pixel_tolerance)
-    line1 = lines[0]
-    line2 = lines[1]
+    x_idx, y_idx = _separate_line_indices(points, pixel_tolerance)
+    line1 = [points[i] for i in x_idx]
+    line2 = [points[i] for i in y_idx]
+    # Broad-phase index for the sweep overlap queries: one AABB array per
+    # axis line, tested against each candidate box in a single reduction.
+    if aabbs is not None:
+        line1_aabbs = aabbs[x_idx]
+        line2_aabbs = aabbs[y_idx]
+    else:
+        line1_aabbs = _to_aabb_array(line1) if line1 else np.empty((0, 4), dtype=np.float32)
+        line2_aabbs = _to_aabb_array(line2) if line2 else np.empty((0, 4), dtype=np.float32)
     period_x = find_center_period(points, axis=0) * 2
     period_y = find_center_period(points, axis=1) * 2
     label_period_x = find_period(points, 0)
@@ -147,40 +383,61 @@ def find_missing_points(points, pixel_tolerance=1):
     max_x = max(points, key=lambda point: point[1][0])[1][0]
     min_y = min(points, key=lambda point: point[1][1])[1][1]
     max_y = max(points, key=lambda point: point[1][1])[1][1]
-    existing_labels_x = [float(point[2]) for point in points if point in line1]
-    existing_labels_y = [float(point[2]) for point in points if point in line2]
-    dx = []
-    dy = []
-    for point in points:
-        dx.append(point[0][1][0] - point[0][0][0])
-        dy.append(point[0][2][1] - point[0][1][1])
-    w = sum(dx) / len(dx)
-    h = sum(dy) / len(dy)
-    for x in range(int(min_x), int(max_x), period_x):
-        found = any(abs(point[1][1] - line1[0][1][1]) <= pixel_tolerance for point in points)
-        if not found:
-            label = max(existing_labels_x + [0]) - label_period_x
+    # Sets give O(1) membership for the label-search loops below; new labels
+    # are always below the starting maximum, so the base is hoisted.
+    existing_labels_x = {float(points[i][2]) for i in x_idx}
+    existing_labels_y = {float(points[i][2]) for i in y_idx}
+    base_label_x = max(existing_labels_x | {0})
+    base_label_y = max(existing_labels_y | {0})
+    corners = np.asarray([point[0] for point in points], dtype=np.float64)
+    w = float((corners[:, 1, 0] - corners[:, 0, 0]).mean())
+    h = float((corners[:, 2, 1] - corners[:, 1, 1]).mean())
+    centers_y = np.asarray([point[1][1] for point in points], dtype=np.float64)
+    xs = np.arange(int(min_x), int(max_x), period_x)
+    # The candidate row sits on the x axis line, so the "already present"
+    # test is one reduction shared by every sweep step.
+    if xs.size and not np.any(np.abs(centers_y - line1[0][1][1]) <= pixel_tolerance):
+        y = line1[0][1][1]
+        cand = np.stack(
+            [xs - w / 2, np.full(xs.shape, y - h / 2), xs + w / 2, np.full(xs.shape, y + h / 2)], axis=1
+        ).astype(np.float32)
+        overlap = (
+            (cand[:, None, 2] >= line1_aabbs[None, :, 0])
+            & (cand[:, None, 0] <= line1_aabbs[None, :, 2])
+            & (cand[:, None, 3] >= line1_aabbs[None, :, 1])
+            & (cand[:, None, 1] <= line1_aabbs[None, :, 3])
+        ).any(axis=1)
+        for x in xs[~overlap]:
+            x = int(x)
+            label = base_label_x - label_period_x
             while label in existing_labels_x:
                 label -= label_period_x
-            y = line1[0][1][1]
             rect = [[x - w / 2, y - h / 2], [x + w / 2, y - h / 2], [x + w / 2, y + h / 2], [x - w / 2, y + h / 2]]
-
-            overlap = any(is_rect_overlapping(rect, point[0]) for point in points if point in line1)
-            if not overlap:
-                missing_points.append([rect, [x, y], label])
-                existing_labels_x.append(label)
-    for y in range(int(min_y), int(max_y), period_y):
-        found = any(abs(point[1][1] - y) <= pixel_tolerance for point in points)
-        if not found:
-            label = max(existing_labels_y + [0]) - label_period_y
+            missing_points.append([rect, [x, y], label])
+            existing_labels_x.add(label)
+    ys = np.arange(int(min_y), int(max_y), period_y)
+    if ys.size:
+        found = (np.abs(centers_y[None, :] - ys[:, None]) <= pixel_tolerance).any(axis=1)
+        ys = ys[~found]
+    if ys.size:
+        x = line2[0][1][0]
+        cand = np.stack(
+            [np.full(ys.shape, x - w / 2), ys - h / 2, np.full(ys.shape, x + w / 2), ys + h / 2], axis=1
+        ).astype(np.float32)
+        overlap = (
+            (cand[:, None, 2] >= line2_aabbs[None, :, 0])
+            & (cand[:, None, 0] <= line2_aabbs[None, :, 2])
+            & (cand[:, None, 3] >= line2_aabbs[None, :, 1])
+            & (cand[:, None, 1] <= line2_aabbs[None, :, 3])
+        ).any(axis=1)
+        for y in ys[~overlap]:
+            y = int(y)
+            label = base_label_y - label_period_y
             while label in existing_labels_y:
                 label -= label_period_y
-            x = line2[0][1][0]
             rect = [[x - w / 2, y - h / 2], [x + w / 2, y - h / 2], [x + w / 2, y + h / 2], [x - w / 2, y + h / 2]]
-            overlap = any(is_rect_overlapping(rect, point[0]) for point in points if point in line2)
-            if not overlap:
-                missing_points.append([rect, [x, y], label])
-                existing_labels_y.append(label)
+            missing_points.append([rect, [x, y], label])
+            existing_labels_y.add(label)
     return missing_points
 
 
@@ -195,20 +452,37 @@ def separate_lines(points, pixel_tolerance=1):
     Returns:
         tuple: Two lists of points separated by X and Y parallel lines.
     """
-    x_parallel_line = []
-    y_parallel_line = []
+    x_idx, y_idx = _separate_line_indices(points, pixel_tolerance)
+    return [[points[i] for i in x_idx], [points[i] for i in y_idx]]
+
+
+def _separate_line_indices(points, pixel_tolerance=1):
+    """
+    Separate points into X and Y parallel lines, by index.
+
+    Args: points (list): List of points in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x,
+    center_y], label]. pixel_tolerance (int, optional): The maximum allowable difference in pixel coordinates.
+    Default is 1.
+
+    Returns:
+        tuple: Two lists of point indices, for the X and Y parallel lines.
+    """
+    x_idx: list = []
+    y_idx: list = []
+    x_seen: set = set()
+    y_seen: set = set()
     for i in range(len(points) - 1):
         if abs(int(points[i][1][1]) - int(points[i + 1][1][1])) <= pixel_tolerance:
-            if points[i] not in x_parallel_line:
-                x_parallel_line.append(points[i])
-            if points[i + 1] not in x_parallel_line:
-                x_parallel_line.append(points[i + 1])
+            for j in (i, i + 1):
+                if j not in x_seen:
+                    x_seen.add(j)
+                    x_idx.append(j)
         elif abs(int(points[i][1][0]) - int(points[i + 1][1][0])) <= pixel_tolerance:
-            if points[i] not in y_parallel_line:
-                y_parallel_line.append(points[i])
-            if points[i + 1] not in y_parallel_line:
-                y_parallel_line.append(points[i + 1])
-    return [x_parallel_line, y_parallel_line]
+            for j in (i, i + 1):
+                if j not in y_seen:
+                    y_seen.add(j)
+                    y_idx.append(j)
+    return x_idx, y_idx
 
 
 def find_actual_points(points, pixel_tolerance=1):
@@ -223,10 +497,14 @@ def find_actual_points(points, pixel_tolerance=1):
     y1], [x2, y2], [x3, y3], [x4, y4]], [center_x, center_y], label].
     """
     x_parallel_line, y_parallel_line = separate_lines(points, pixel_tolerance)
-    lines_x = sorted(x_parallel_line, key=lambda point: point[2])
-    lines_y = sorted(y_parallel_line, key=lambda point: point[2])
+    lines_x = _sorted_by(x_parallel_line, [point[2] for point in x_parallel_line])
+    lines_y = _sorted_by(y_parallel_line, [point[2] for point in y_parallel_line])
     if abs(lines_x[0][1][1] - lines_y[0][1][1]) <= pixel_tolerance:
         raise ValueError("Lines are parallel")
+    if not are_lines_orthogonal(
+        (lines_x[0][1], lines_x[-1][1]), (lines_y[0][1], lines_y[-1][1])
+    ):
+        raise ValueError("Lines are not orthogonal")
     actual_points_x = [[[lines_x[0][1][0], lines_y[0][1][1]], [lines_x[0][2], lines_y[0][2]]]]
     actual_points_y = [[[lines_x[0][1][0], lines_y[0][1][1]], [lines_x[0][2], lines_y[0][2]]]]
     actual_points_x.extend([[point[1][0], lines_y[0][1][1]], [point[2], lines_y[0][2]]] for point in lines_x[1:])
@@ -234,6 +512,36 @@ def find_actual_points(points, pixel_tolerance=1):
     return actual_points_x, actual_points_y
 
 
+@lru_cache(maxsize=32)
+def _run_ocr(img_path: str):
+    """
+    Run OCR on an image and collect the numeric detections.
+
+    Axis ticks are digits, so one pass of the English model with the angle
+    classifier disabled replaces the previous five-language cls=True sweep;
+    everything the extra models produced was discarded by the numeric filter
+    anyway. The result is cached per path, so repeated find_points calls on
+    the same image skip inference entirely. Detections are returned as
+    nested tuples so the cached value cannot be mutated by callers.
+
+    Parameters:
+        img_path (str): The path to the scientific figure image.
+
+    Returns:
+        tuple: (box, label) pairs, where box is a tuple of 4 corner tuples.
+    """
+    detections = []
+    ocr = _get_ocr("en")
+    result = ocr.ocr(img_path, cls=False)
+    for res in result:
+        detections.extend(
+            (tuple(tuple(corner) for corner in line[0]), float(line[1][0]))
+            for line in res
+            if line[1][0].isnumeric()
+        )
+    return tuple(detections)
+
+
 def find_points(img_path, pixel_tolerance=1):
     """
     Find the actual points (intersections) on the X and Y axes in a scientific figure image.
@@ -242,31 +550,34 @@ def find_points(img_path, pixel_tolerance=1):
         img_path (str): The path to the scientific figure image.
         pixel_tolerance (int, optional): The maximum allowable difference in pixel coordinates. Default is 1.
 
-    Returns: list: A list of actual points (intersections) on the X and Y axes, including the origin and two points
-    on each axis. Each point is in the format [[[x1, y1], [x2, y2], [x3, y3], [x4, y4]], [center_x, center_y], label].
-    """
-    points = []
-    for lang in [
-        "latin",
-        "arabic",
-        "cyrillic",
-        "devanagari",
-        "ch",
-    ]:
-        ocr = PaddleOCR(use_angle_cls=True, lang=lang)
-        result = ocr.ocr(str(img_path), cls=True)
-        for res in result:
-            points.extend([line[0], None, float(line[1][0])] for line in res if line[1][0].isnumeric())
-    points = sorted(points, key=lambda rect: rect[0][0][0])
-    points = remove_overlapping_rectangles(remove_duplicate_rectangles(points))
-    for point in points:
-        coords = point[0]
-        x = [coord[0] for coord in coords]
-        y = [coord[1] for coord in coords]
-        center_x = int((min(x) + max(x)) / 2)
-        center_y = int((min(y) + max(y)) / 2)
-        points[points.index(point)][1] = [center_x, center_y]
-    points.extend(find_missing_points(points, pixel_tolerance))
-    points = sorted(points, key=lambda rect: rect[0][0][0])
+    Returns: np.ndarray: A (3, 2, 2) float32 array of the origin and one reference point per axis, where row[0] is
+    the pixel location [x, y] and row[1] is the label pair [label_x, label_y].
+    """
+    points = [
+        [[list(corner) for corner in box], None, label]
+        for box, label in _run_ocr(str(img_path))
+    ]
+    points = _sorted_by(points, [point[0][0][0] for point in points])
+    aabbs = None
+    if points:
+        # One corner min/max pass feeds the duplicate filter, the overlap
+        # filter, the centers, and the missing-point sweeps below.
+        corners = np.asarray([point[0] for point in points], dtype=np.float32)
+        keep = _duplicate_keep_indices(corners)
+        points = [points[i] for i in keep]
+        corners = corners[keep]
+        aabbs = np.concatenate((corners.min(axis=1), corners.max(axis=1)), axis=1)
+        keep = _overlap_keep_indices(aabbs)
+        points = [points[i] for i in keep]
+        aabbs = aabbs[keep]
+        centers = ((aabbs[:, :2] + aabbs[:, 2:]) * 0.5).astype(np.int32)
+        for i, center in enumerate(centers):
+            points[i][1] = center.tolist()
+    points.extend(find_missing_points(points, pixel_tolerance, aabbs=aabbs))
+    points = _sorted_by(points, [point[0][0][0] for point in points])
     actual_points_x, actual_points_y = find_actual_points(points, pixel_tolerance)
-    return [actual_points_x[0], actual_points_x[1], actual_points_y[1]]
+    out = np.empty((3, 2, 2), dtype=np.float32)
+    out[0] = actual_points_x[0]
+    out[1] = actual_points_x[1]
+    out[2] = actual_points_y[1]
+    return out
@@ -8,18 +8,15 @@ Functions:
     normalize(img: np.ndarray) -> np.ndarray:
         Normalize the pixel values of the image to a range between 0 and 255.
 
-    fit_trajectory_using_median(traj: Dict[int, List[int]], T: Tuple[Tuple[float, float], Tuple[float, float]],
-    img: np.ndarray) -> List[Tuple[float, float]]: Fit the trajectory points to the Y = mX + offset model using the
+    fit_trajectory_using_median(traj: Tuple[np.ndarray, ...], T: Tuple[Tuple[float, float], Tuple[float, float]],
+    img: np.ndarray) -> np.ndarray: Fit the trajectory points to the Y = mX + offset model using the
     median method.
 
-    find_trajectory(img: np.ndarray, pixel: int, T: Tuple[Tuple[float, float], Tuple[float, float]]) -> Tuple[List[
-    Tuple[float, float]], np.ndarray]: Find the trajectory points of the specified pixel color in the image.
+    find_trajectory(img: np.ndarray, pixel: int, T: Tuple[Tuple[float, float], Tuple[float, float]]) -> Tuple[
+    np.ndarray, np.ndarray]: Find the trajectory points of the specified pixel color in the image.
 
-    _valid_px(val: int) -> int:
-        Ensure that a pixel value is within the valid range of 0 to 255.
-
-    _find_center(vec: np.ndarray) -> np.float64:
-        Find the median of a given vector.
+    find_trajectories(img: np.ndarray, pixels: List[int], T: Tuple[Tuple[float, float], Tuple[float, float]]) ->
+    List[np.ndarray]: Find the trajectories of several pixel colors with one classification pass over the image.
 
 Usage:
     from .trajectory import normalize, fit_trajectory_using_median, find_trajectory
@@ -44,24 +41,10 @@ Usage:
 
 """
 import logging
-from collections import defaultdict
 import numpy as np
 import cv2 as cv
 
 
-def _find_center(vec):
-    """
-    Find the median of a given vector.
-
-    Parameters:
-        vec (np.ndarray): The input vector as a NumPy array.
-
-    Returns:
-        np.float64: The median value of the input vector.
-    """
-    return np.median(vec)
-
-
 # Thanks https://codereview.stackexchange.com/a/185794
 def normalize(img):
     """
@@ -73,6 +56,13 @@ def normalize(img):
     Returns:
         np.ndarray: The normalized image as a NumPy array with pixel values ranging from 0 to 255.
     """
+    if img.dtype == np.uint8:
+        # Interpolating the 256 possible values once and applying them with
+        # cv.LUT avoids promoting the whole image to float64 and back; the
+        # extrema come from one cv.minMaxLoc pass instead of two reductions.
+        lo, hi = cv.minMaxLoc(img)[:2]
+        lut = np.interp(np.arange(256), (lo, hi), (0, 255)).astype(np.uint8)
+        return cv.LUT(img, lut)
     return np.interp(img, (img.min(), img.max()), (0, 255)).astype(np.uint8)
 
 
@@ -80,92 +70,186 @@ def fit_trajectory_using_median(traj, T, img):
     """
     Fit the trajectory points to the Y = mX + offset model using the median method.
 
-    Parameters: traj (Dict[int, List[int]]): A dictionary containing x-coordinate (int) as keys and corresponding
-    list of y-coordinates (List[int]) as values, representing the trajectory points in the image. T (Tuple[Tuple[
-    float, float], Tuple[float, float]]): A tuple of two tuples, each containing scaling factors (float) and offsets
-    (float) for X and Y axes, respectively. img (np.ndarray): The input image as a NumPy array.
+    Parameters: traj (Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]): The trajectory pixels grouped by
+    column, as (cols, starts, ends, Ys) where cols holds the distinct x-coordinates in ascending order, Ys holds the
+    y-coordinates sorted by column, and starts/ends delimit each column's slice of Ys. T (Tuple[Tuple[float, float],
+    Tuple[float, float]]): A tuple of two tuples, each containing scaling factors (float) and offsets (float) for X
+    and Y axes, respectively. img (np.ndarray): The input image as a NumPy array.
 
-    Returns: List[Tuple[float, float]]: A list of tuples, each containing the fitted data points of the trajectory in
-    data coordinates (X, Y).
+    Returns:
+        np.ndarray: An (N, 2) float64 array of the fitted trajectory in data coordinates (X, Y), ascending in X.
     """
     (sX, sY), (offX, offY) = T
-    res = []
     r, _ = img.shape
+    cols, starts, ends, Ys = traj
+    lengths = ends - starts
+
+    # For each x, we may multiply pixels in column of the image which might
+    # be y. Usually experience is that the trajectories are close to the
+    # top rather to the bottom. So we discard call pixel which are below
+    # the center of mass (median here)
+    # These are opencv pixles. So there valus starts from the top. 0
+    # belogs to top row. Therefore > rather than <.
+    # Ys is sorted within each column, so every median is index arithmetic
+    # and all columns are reduced together instead of two np.median calls
+    # per column.
+    mid = starts + lengths // 2
+    avg = np.where(lengths % 2, Ys[mid], (Ys[mid - 1] + Ys[mid]) * 0.5)
+
+    # Count the discarded (< median) prefix of every column in one
+    # segmented reduction; the surviving slice is [starts + cut, ends).
+    cut = np.add.reduceat(Ys < np.repeat(avg, lengths), starts)
+
+    # Still we have multiple candidates for y for each x.
+    # We find the center of these points and call it the y for given x.
+    starts = starts + cut
+    lengths = ends - starts
+    mid = starts + lengths // 2
+    y = np.where(lengths % 2, Ys[mid], (Ys[mid - 1] + Ys[mid]) * 0.5)
+
+    # Mark every fitted center with one fancy-indexed store instead of a
+    # cv.circle call per column.
+    yi = y.astype(np.int32)
+    np.clip(yi, 0, r - 1, out=yi)
+    img[yi, cols] = 255
+
+    # Columns are already visited in ascending X, so the result needs no
+    # final sort and can be emitted as one array.
+    out = np.empty((len(cols), 2), dtype=np.float64)
+    out[:, 0] = (cols - offX) / sX
+    out[:, 1] = (r - y - offY) / sY
+    return out
+
+
+_composite_buf = None
+
+
+def _composite(img, new):
+    """
+    Stack the input image over the visualization into a reused buffer.
 
-    # x, y = zip(*sorted(traj.items()))
-    # logging.info((xvec, ys))
+    Parameters:
+        img (np.ndarray): The input image.
+        new (np.ndarray): The visualization image of the same shape.
+
+    Returns:
+        np.ndarray: A (2H, W) buffer holding img over new, reused across calls of the same shape.
+    """
+    global _composite_buf
+    rows = img.shape[0]
+    shape = (2 * rows,) + img.shape[1:]
+    if _composite_buf is None or _composite_buf.shape != shape or _composite_buf.dtype != img.dtype:
+        _composite_buf = np.empty(shape, dtype=img.dtype)
+    _composite_buf[:rows] = img
+    _composite_buf[rows:] = new
+    return _composite_buf
 
-    for k in sorted(traj):
-        x = k
 
-        vals = np.array(traj[k])
+def _extract_trajectory(img, pts, T, viz_buf=None):
+    """
+    Group foreground coordinates by column and fit the trajectory.
 
-        # For each x, we may multiply pixels in column of the image which might
-        # be y. Usually experience is that the trajectories are close to the
-        # top rather to the bottom. So we discard call pixel which are below
-        # the center of mass (median here)
-        # These are opencv pixles. So there valus starts from the top. 0
-        # belogs to top row. Therefore > rather than <.
-        avg = np.median(vals)
-        vals = vals[np.where(vals >= avg)]
-        if len(vals) == 0:
-            continue
+    Parameters:
+        img (np.ndarray): The input image as a NumPy array.
+        pts (np.ndarray): The (N, 1, 2) coordinates from cv.findNonZero, or None when the mask was empty.
+        T (Tuple[Tuple[float, float], Tuple[float, float]]): The axis scaling factors and offsets.
+        viz_buf (np.ndarray, optional): A buffer shaped like img for the debug visualization.
 
-        # Still we have multiple candidates for y for each x.
-        # We find the center of these points and call it the y for given x.
-        y = _find_center(vals)
-        cv.circle(img, (x, int(y)), 1, 255, -1)
-        x1 = (x - offX) / sX
-        y1 = (r - y - offY) / sY
-        res.append((x1, y1))
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The fitted (N, 2) trajectory and the visualization image.
+    """
+    assert pts is not None, "Empty trajectory"
+    pts = pts.reshape(-1, 2)
+    # The reshaped findNonZero columns are strided views; one explicit
+    # contiguous copy here lets the sort and grouping below run zero-copy.
+    X = np.ascontiguousarray(pts[:, 0], dtype=np.int32)
+    Y = np.ascontiguousarray(pts[:, 1], dtype=np.int32)
+
+    # Group the pixels by column with a counting sort: column indices are
+    # bounded by the image width, so bincount plus cumsum yields the segment
+    # boundaries directly and the stable integer argsort (a radix sort in
+    # NumPy) only permutes Y. cv.findNonZero scans row-major, so a stable
+    # sort keeps each column's Ys ascending, which the index-based medians
+    # in fit_trajectory_using_median rely on.
+    counts = np.bincount(X)
+    cols = np.flatnonzero(counts)
+    ends = np.cumsum(counts[cols])
+    starts = ends - counts[cols]
+    Ys = Y[np.argsort(X, kind="stable")]
 
-    # sort by x-axis.
-    return sorted(res)
+    # this is a simple fit using median.
+    if viz_buf is None:
+        new = np.zeros_like(img)
+    else:
+        new = viz_buf
+        new.fill(0)
+    res = fit_trajectory_using_median((cols, starts, ends, Ys), T, new)
+    return res, new
 
 
-def _valid_px(val: int) -> int:
+def find_trajectories(img: np.ndarray, pixels, T, viz_buf=None):
     """
-    Ensure that a pixel value is within the valid range of 0 to 255.
+    Find the trajectories of several pixel colors with one pass over the image.
 
-    Parameters:
-        val (int): The pixel value to validate.
+    A 256-entry lookup table bins every pixel into its color class in a
+    single cv.LUT traversal, so the image is read once for all colors
+    instead of once per cv.inRange call. Overlapping color windows are
+    resolved in favor of the later color in pixels.
+
+    Parameters: img (np.ndarray): The input image as a NumPy array. pixels (List[int]): The pixel colors to find
+    trajectories for in the image. T (Tuple[Tuple[float, float], Tuple[float, float]]): A tuple of two tuples,
+    each containing scaling factors (float) and offsets (float) for X and Y axes, respectively. viz_buf (np.ndarray,
+    optional): A buffer shaped like img, zeroed and reused for each color's visualization.
 
     Returns:
-        int: The pixel value restricted to the range of 0 to 255.
+        List[np.ndarray]: One fitted (N, 2) trajectory per entry of pixels.
     """
-    return min(max(0, val), 255)
-
-
-def find_trajectory(img: np.ndarray, pixel: int, T):
+    assert len(pixels) < 255, "Too many trajectory colors"
+    origin = 6
+    lut = np.full(256, 255, dtype=np.uint8)
+    for idx, pixel in enumerate(pixels):
+        lut[max(0, pixel - origin // 2): min(255, pixel + origin // 2) + 1] = idx
+    labels = cv.LUT(img, lut)
+    trajectories = []
+    for idx, pixel in enumerate(pixels):
+        logging.info("Extracting trajectory for color %s", pixel)
+        pts = cv.findNonZero(cv.compare(labels, idx, cv.CMP_EQ))
+        res, _ = _extract_trajectory(img, pts, T, viz_buf)
+        trajectories.append(res)
+    return trajectories
+
+
+def find_trajectory(img: np.ndarray, pixel: int, T, viz_buf=None):
     """
     Find the trajectory points of the specified pixel color in the image.
 
     Parameters: img (np.ndarray): The input image as a NumPy array. pixel (int): The pixel color to find the
     trajectory for in the image. T (Tuple[Tuple[float, float], Tuple[float, float]]): A tuple of two tuples,
-    each containing scaling factors (float) and offsets (float) for X and Y axes, respectively.
+    each containing scaling factors (float) and offsets (float) for X and Y axes, respectively. viz_buf (np.ndarray,
+    optional): A buffer shaped like img for the debug visualization; it is zeroed and reused instead of allocating a
+    fresh image, which matters when extracting many colors from the same plot.
 
     Returns:
-        Tuple[List[Tuple[float, float]], np.ndarray]: A tuple containing:
-            - A list of tuples, each containing the found data points of the trajectory in data coordinates (X, Y).
+        Tuple[np.ndarray, np.ndarray]: A tuple containing:
+            - An (N, 2) float64 array of the found data points of the trajectory in data coordinates (X, Y).
             - The processed image as a NumPy array with additional visualizations for debugging purposes.
     """
-    logging.info(f"Extracting trajectory for color {pixel}")
-    assert (
-        img.min() <= pixel <= img.max()
-    ), f"{pixel} is outside the range: [{img.min()}, {img.max()}]"
+    logging.info("Extracting trajectory for color %s", pixel)
+    # One cv.minMaxLoc pass finds both extrema instead of separate min()
+    # and max() scans over the image.
+    lo, hi = cv.minMaxLoc(img)[:2]
+    assert lo <= pixel <= hi, f"{pixel} is outside the range: [{lo}, {hi}]"
 
     # Find all pixels which belongs to a trajectory.
     origin = 6
-    _clower, _cupper = _valid_px(pixel - origin // 2), _valid_px(pixel + origin // 2)
-
-    Y, X = np.where((img >= _clower) & (img <= _cupper))
-    traj = defaultdict(list)
-    for x, y in zip(X, Y):
-        traj[x].append(y)
+    _clower = max(0, pixel - origin // 2)
+    _cupper = min(255, pixel + origin // 2)
 
-    assert traj, "Empty trajectory"
+    # cv.inRange does the double comparison in one SIMD pass over the image
+    # and cv.findNonZero emits the coordinates without scanning a boolean
+    # temporary, replacing the three NumPy passes used before.
+    mask = cv.inRange(img, _clower, _cupper)
+    pts = cv.findNonZero(mask)
 
-    # this is a simple fit using median.
-    new = np.zeros_like(img)
-    res = fit_trajectory_using_median(traj, T, new)
-    return res, np.vstack((img, new))
+    res, new = _extract_trajectory(img, pts, T, viz_buf)
+    return res, _composite(img, new)
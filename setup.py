@@ -44,9 +44,13 @@ setup(
         "opencv-python",
         "numpy",
         "matplotlib",
-        "paddlepaddle",
-        "paddleocr==2.6.1.3"
     ],
+    extras_require={
+        "ocr": [
+            "paddlepaddle",
+            "paddleocr==2.6.1.3"
+        ]
+    },
     project_urls={
         "Bug Reports": "https://github.com/eftalgezer/PlotScan/issues",
         "Source": "https://github.com/eftalgezer/PlotScan",
@@ -24,11 +24,12 @@ Functions:
         Helper function to check the validity of the generated CSV trajectory file.
 """
 
-import subprocess
 import tempfile
 from pathlib import Path
 import numpy as np
+import pytest
 import PlotScan
+from PlotScan.__main__ import main
 from PlotScan.geometry import Point, find_origin
 from PlotScan.grid import *
 
@@ -48,20 +49,18 @@ def _run_cmdline(infile: Path, points=None, locations=None):
     Returns:
         Path: The path of the generated trajectory file.
     """
-    pts = None
-    locs = None
-    cmd = f"PlotScan {str(infile)} "
-    if points:
-        pts = " ".join([f"-p {','.join(map(str,pt))}" for pt in points])
-    if locations:
-        locs = " ".join([f"-l {','.join(map(str,pt))}" for pt in locations])
+    argv = [str(infile)]
     if points and locations:
-        cmd += f"{pts} {locs}"
+        for pt in points:
+            argv += ["-p", ",".join(map(str, pt))]
+        for loc in locations:
+            argv += ["-l", ",".join(map(str, loc))]
     outfile = infile.with_suffix(".result.png")
     trajfile = infile.with_suffix(".result.csv")
-    cmd += f" --plot {str(outfile)} --output {trajfile}"
-    r = subprocess.run(cmd, check=True, shell=True)
-    assert r.returncode == 0, f"Failed test {r.returncode}"
+    argv += ["--plot", str(outfile), "--output", str(trajfile)]
+    # Calling the entry point in-process avoids respawning the interpreter
+    # (and re-importing cv2/numpy) for every test.
+    main(argv)
     return trajfile
 
 
@@ -92,6 +91,9 @@ def _save_fig(img, outfile):
 
 def test_trimmeed():
     """Test if the application can process the 'trimmed.png' image and generate a trajectory file."""
+    # No axis points are given, so this exercises the OCR path, which needs
+    # the optional PlotScan[ocr] extra.
+    pytest.importorskip("paddleocr")
     csvfile = _run_cmdline(
         HERE / ".." / "figures" / "trimmed.png"
     )
@@ -126,6 +128,9 @@ def test_ecg():
 
 def test_grid():
     """Test if the application can process the 'graph_with_grid.png' image and generate a trajectory file."""
+    # No axis points are given, so this exercises the OCR path, which needs
+    # the optional PlotScan[ocr] extra.
+    pytest.importorskip("paddleocr")
     csvfile = _run_cmdline(
         HERE / ".." / "figures" / "graph_with_grid.png"
     )